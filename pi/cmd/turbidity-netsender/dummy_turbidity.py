@@ -22,6 +22,7 @@
 #   You should have received a copy of the GNU General Public License
 #   in gpl.txt.  If not, see http://www.gnu.org/licenses.
 
+import os
 import random
 import time
 import sys
@@ -30,15 +31,16 @@ import sys
 FMT_LINE = "??-"
 DELAY    = 1 #second.
 
+# Pre-encoded output for every possible reading, so each reading is written
+# with a single unbuffered write.
+PAYLOADS = tuple(("%s\n%d\n" % (FMT_LINE, n)).encode() for n in range(3400, 3501))
+
 # Returns dummy turbidity value in same format as remond Turbidity Sensor.
 # Int range is arbitrary but set to 3400 < n < 3500 to allow for expecations.
 def main():
+    fd = sys.stdout.fileno()
     while True:
-        turbidity    = random.randint(3400,3500)
-        print(FMT_LINE)
-        sys.stdout.flush()
-        print(turbidity)
-        sys.stdout.flush()
+        os.write(fd, random.choice(PAYLOADS))
         time.sleep(DELAY)
 
 if __name__ == "__main__":
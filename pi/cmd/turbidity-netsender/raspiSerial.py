@@ -22,22 +22,35 @@
 #   You should have received a copy of the GNU General Public License
 #   in gpl.txt.  If not, see http://www.gnu.org/licenses.
 
+import os
 import serial
-import time
 import sys
 
 #  Const.
-DELAY     = 0.1 #seconds
 BAUD_RATE = 9600
+READ_SIZE = 4096 #bytes
 
-ser=serial.Serial('/dev/ttyACM0',BAUD_RATE)
+# Reads block until data is available, so no polling delay is needed.
+ser=serial.Serial('/dev/ttyACM0',BAUD_RATE,timeout=None)
 
+# Read whatever bytes are available in one call and split lines ourselves,
+# rather than letting readline fetch a byte at a time.
 def main():
+    fd = ser.fileno()
+    os.set_blocking(fd, True)
+    out = sys.stdout.buffer
+    buf = bytearray()
     while True:
-        turbidity = ser.readline()
-        print(turbidity.decode('latin1'))
-        sys.stdout.flush()
-        time.sleep(DELAY)
+        chunk = os.read(fd, READ_SIZE)
+        if not chunk:
+            break # Port closed.
+        buf += chunk
+        nl = buf.rfind(b'\n')
+        if nl == -1:
+            continue
+        out.write(buf[:nl+1])
+        del buf[:nl+1]
+        out.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file